@@ -0,0 +1,50 @@
+"""Group queued frames into inference batches."""
+
+from __future__ import annotations
+
+from queue import Empty, Queue
+from time import monotonic
+from typing import Any, Sequence
+
+
+class BatchAssembler:
+    """Collects up to ``batch_size`` items, flushing after ``max_wait_ms``.
+
+    The wait starts when the first item of a batch arrives, so a lone frame is
+    delayed by at most ``max_wait_ms`` before it is submitted on its own.
+    """
+
+    def __init__(self, batch_size: int, max_wait_ms: float) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms must be >= 0")
+        self.batch_size = batch_size
+        self.max_wait_ms = max_wait_ms
+
+    def collect(self, first: Any, queue: Queue) -> list[Any]:
+        """Return a batch starting with ``first`` and topped up from ``queue``."""
+        batch = [first]
+        deadline = monotonic() + self.max_wait_ms / 1000
+        while len(batch) < self.batch_size:
+            remaining = deadline - monotonic()
+            try:
+                if remaining <= 0:
+                    batch.append(queue.get_nowait())
+                else:
+                    batch.append(queue.get(timeout=remaining))
+            except Empty:
+                break
+        return batch
+
+
+def split_bindings(bindings_list: Any, count: int) -> Sequence[Any] | None:
+    """Split a batch callback's ``bindings_list`` into one entry per frame.
+
+    Returns ``None`` when the result cannot be matched to the submitted frames.
+    """
+    if count == 1:
+        return [bindings_list]
+    if isinstance(bindings_list, (list, tuple)) and len(bindings_list) == count:
+        return bindings_list
+    return None
@@ -4,33 +4,65 @@ from __future__ import annotations
 
 import logging
 import threading
+from dataclasses import dataclass
 from queue import Full, Queue
-from typing import Callable, Optional, Protocol
+from time import monotonic, time
+from typing import Any, Callable, Optional, Protocol
 
-logger = logging.getLogger(__name__)
 import cv2
 
+from .frame_buffers import FrameRing, read_frame
+
+logger = logging.getLogger(__name__)
+
 
 class _Capture(Protocol):
-    def read(self):  # pragma: no cover - protocol stub
+    def read(self, image=None):  # pragma: no cover - protocol stub
         ...
 
     def release(self) -> None:  # pragma: no cover - protocol stub
         ...
 
 
+@dataclass(frozen=True)
+class CapturedFrame:
+    """A camera frame with the clocks sampled right after it was read."""
+
+    image: Any
+    captured_at: float
+    timestamp_ms: int
+
+
 class CameraClient:
-    """Reads frames from a camera device and enqueues them for processing."""
+    """Reads frames from a camera device and enqueues them for processing.
+
+    Frames are decoded into a fixed ring of preallocated buffers. By default
+    the ring has ``frame_queue.maxsize + 2`` slots: one per queued frame, one
+    held by the consumer and one being written. ``buffer_slots=0`` disables
+    reuse, which is also the default for unbounded queues.
+
+    When ``frame_queue`` is a ``DropQueue`` its overflow policy decides which
+    frame is lost on overflow: ``drop_oldest`` keeps the freshest frames for
+    consumers that care about latency. Plain queues drop the new frame.
+
+    Frames are enqueued as ``CapturedFrame`` so downstream stages can measure
+    latency from the moment of capture.
+    """
 
     def __init__(
         self,
         frame_queue: Queue,
         camera_index: int = 0,
         capture_factory: Optional[Callable[[int], _Capture]] = None,
+        buffer_slots: Optional[int] = None,
     ) -> None:
         self._frame_queue = frame_queue
         self._camera_index = camera_index
         self._capture_factory = capture_factory
+        if buffer_slots is None:
+            maxsize = getattr(frame_queue, "maxsize", 0)
+            buffer_slots = maxsize + 2 if maxsize > 0 else 0
+        self._buffer_slots = buffer_slots
         self._stop_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
 
@@ -51,21 +83,28 @@ class CameraClient:
     def _run(self) -> None:
         capture_factory = self._capture_factory or self._default_capture_factory
         cap = capture_factory(self._camera_index)
+        ring = FrameRing(self._buffer_slots) if self._buffer_slots > 0 else None
         try:
             while not self._stop_event.is_set():
-                ret, frame = cap.read()
+                ret, frame = read_frame(cap, ring)
                 if not ret:
                     logger.warning("Camera read returned no frame")
                     break
-                try:
-                    self._frame_queue.put_nowait(frame)
-                except Full:
-                    # Drop frames if downstream is slower than capture.
-                    logger.debug("Dropping frame because queue is full")
-                    pass
+                self._enqueue(CapturedFrame(frame, monotonic(), int(time() * 1000)))
         finally:
             cap.release()
 
+    def _enqueue(self, frame: CapturedFrame) -> None:
+        offer = getattr(self._frame_queue, "offer", None)
+        if offer is not None:
+            offer(frame)
+            return
+        try:
+            self._frame_queue.put_nowait(frame)
+        except Full:
+            # Drop frames if downstream is slower than capture.
+            logger.debug("Dropping frame because queue is full")
+
     @staticmethod
     def _default_capture_factory(camera_index: int) -> _Capture:
         return cv2.VideoCapture(camera_index)
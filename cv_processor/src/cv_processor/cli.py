@@ -4,8 +4,11 @@ from __future__ import annotations
 
 import argparse
 import logging
+import signal
 from typing import Iterable, Optional, Type
 
+from sundew_common.queues import OVERFLOW_POLICIES
+
 from .orchestrator import CvOrchestrator
 
 
@@ -13,6 +16,12 @@ def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Run the Sundew CV processor.")
     parser.add_argument("--network", required=True, help="Path to the Hailo HEF.")
     parser.add_argument("--batch-size", type=int, default=1)
+    parser.add_argument(
+        "--batch-max-wait-ms",
+        type=float,
+        default=20.0,
+        help="Submit a partial batch after waiting this long for more frames.",
+    )
     parser.add_argument("--ipc-endpoint")
     parser.add_argument("--ipc-socket-type", default="PUB")
     parser.add_argument(
@@ -24,7 +33,33 @@ def _build_parser() -> argparse.ArgumentParser:
         "--frame-stride",
         type=int,
         default=1,
-        help="Only process 1 in every N frames.",
+        help="Only process 1 in every N frames (initial value with --adaptive-stride).",
+    )
+    parser.add_argument(
+        "--adaptive-stride",
+        action="store_true",
+        help="Adjust the frame stride at runtime from measured pipeline load.",
+    )
+    parser.add_argument("--min-stride", type=int, default=1)
+    parser.add_argument("--max-stride", type=int, default=8)
+    parser.add_argument(
+        "--target-latency-ms",
+        type=float,
+        default=100.0,
+        help="Inference latency budget used by --adaptive-stride.",
+    )
+    parser.add_argument(
+        "--motion-threshold",
+        type=float,
+        default=None,
+        help="Skip inference when the mean grayscale change (0-255) since the "
+        "last inferred frame is below this value.",
+    )
+    parser.add_argument(
+        "--motion-refresh-interval",
+        type=int,
+        default=30,
+        help="Force inference at least once every N gated frames.",
     )
     parser.add_argument(
         "--resize-width",
@@ -38,12 +73,61 @@ def _build_parser() -> argparse.ArgumentParser:
         default=640,
         help="Resize frames to this height before inference.",
     )
+    parser.add_argument(
+        "--input-color",
+        choices=("bgr", "rgb"),
+        default="bgr",
+        help="Channel order expected by the model; rgb converts camera frames.",
+    )
     parser.add_argument("--camera-index", type=int, default=0)
     parser.add_argument("--queue-maxsize", type=int, default=4)
+    parser.add_argument(
+        "--frame-queue-policy",
+        choices=("drop_newest", "drop_oldest"),
+        default="drop_newest",
+        help="Frame dropped when capture outpaces processing; "
+        "drop_oldest always keeps the freshest frames.",
+    )
     parser.add_argument("--max-frames", type=int, default=None)
+    parser.add_argument(
+        "--infer-queue-size",
+        type=int,
+        default=2,
+        help="Resized frames waiting for inference submission.",
+    )
+    parser.add_argument(
+        "--infer-queue-policy",
+        choices=OVERFLOW_POLICIES,
+        default="drop_oldest",
+        help="What to do when the inference queue is full.",
+    )
+    parser.add_argument(
+        "--result-queue-size",
+        type=int,
+        default=8,
+        help="Inference results waiting for serialization and emit.",
+    )
+    parser.add_argument(
+        "--result-queue-policy",
+        choices=OVERFLOW_POLICIES,
+        default="block",
+        help="What to do when the result queue is full.",
+    )
+    parser.add_argument(
+        "--stats-interval",
+        type=float,
+        default=None,
+        help="Log per-stage latency percentiles every N seconds.",
+    )
     return parser
 
 
+def _install_stats_signal(orchestrator: CvOrchestrator) -> None:
+    """Dump latency percentiles on SIGUSR2 where the platform supports it."""
+    if hasattr(signal, "SIGUSR2"):
+        signal.signal(signal.SIGUSR2, lambda _signum, _frame: orchestrator.dump_stats())
+
+
 def main(
     argv: Optional[Iterable[str]] = None,
     orchestrator_cls: Type[CvOrchestrator] = CvOrchestrator,
@@ -60,15 +144,30 @@ def main(
     orchestrator = orchestrator_cls(
         network=args.network,
         batch_size=args.batch_size,
+        batch_max_wait_ms=args.batch_max_wait_ms,
         ipc_endpoint=args.ipc_endpoint,
         ipc_socket_type=args.ipc_socket_type,
         camera_index=args.camera_index,
         queue_maxsize=args.queue_maxsize,
+        frame_queue_policy=args.frame_queue_policy,
         output_console=args.output_console,
         frame_stride=args.frame_stride,
+        adaptive_stride=args.adaptive_stride,
+        min_stride=args.min_stride,
+        max_stride=args.max_stride,
+        target_latency_ms=args.target_latency_ms,
+        motion_threshold=args.motion_threshold,
+        motion_refresh_interval=args.motion_refresh_interval,
         resize_width=args.resize_width,
         resize_height=args.resize_height,
+        input_color=args.input_color,
+        infer_queue_maxsize=args.infer_queue_size,
+        infer_queue_policy=args.infer_queue_policy,
+        result_queue_maxsize=args.result_queue_size,
+        result_queue_policy=args.result_queue_policy,
+        stats_interval_s=args.stats_interval,
     )
+    _install_stats_signal(orchestrator)
     logging.getLogger(__name__).info(
         "Starting CV orchestrator (network=%s, ipc=%s, output_console=%s)",
         args.network,
@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-import math
-from typing import Any, Iterable
+from typing import Any
 
 import numpy as np
 
@@ -25,7 +24,9 @@ COCO_LABELS = (
 )
 
 
-def serialize_detections(bindings_list: Any) -> list[dict[str, Any]]:
+def serialize_detections(
+    bindings_list: Any, *, score_threshold: float = 0.0
+) -> list[dict[str, Any]]:
     """Extract Hailo output buffers and decode class-grouped NMS results.
 
     Hailo's async API gives the callback a list of ``Bindings`` objects, one
@@ -33,6 +34,9 @@ def serialize_detections(bindings_list: Any) -> list[dict[str, Any]]:
     shaped ``(classes, 5, max_detections)``. The five values are
     ``y_min, x_min, y_max, x_max, score``.
 
+    Boxes with a non-finite or non-positive score, or a score below
+    ``score_threshold``, are discarded before any dicts are built.
+
     Plain Python values are still accepted to keep injected test clients and
     non-Hailo callers backwards compatible.
     """
@@ -52,7 +56,7 @@ def serialize_detections(bindings_list: Any) -> list[dict[str, Any]]:
             continue
 
         for output_name, output_buffer in outputs:
-            decoded = _decode_nms_buffer(output_buffer)
+            decoded = _decode_nms_buffer(output_buffer, score_threshold)
             if decoded is not None:
                 detections.extend(decoded)
             else:
@@ -84,35 +88,67 @@ def _extract_outputs(binding: Any) -> list[tuple[str, Any]] | None:
         return None
 
 
-def _decode_nms_buffer(buffer: Any) -> list[dict[str, Any]] | None:
+def _decode_nms_buffer(
+    buffer: Any, score_threshold: float = 0.0
+) -> list[dict[str, Any]] | None:
     """Decode supported Hailo NMS-by-class representations."""
-    class_boxes = _class_box_arrays(buffer)
-    if class_boxes is None:
+    selected = _select_boxes(buffer, score_threshold)
+    if selected is None:
         return None
 
+    class_ids, rows = selected
     detections: list[dict[str, Any]] = []
-    for class_id, boxes in enumerate(class_boxes):
-        for box in boxes:
-            y_min, x_min, y_max, x_max, score = (float(value) for value in box)
-            if not math.isfinite(score) or score <= 0.0:
-                continue
-            detection: dict[str, Any] = {
-                "class_id": class_id,
-                "confidence": score,
-                "bbox": {
-                    "x_min": x_min,
-                    "y_min": y_min,
-                    "x_max": x_max,
-                    "y_max": y_max,
-                },
-            }
-            if class_id < len(COCO_LABELS):
-                detection["label"] = COCO_LABELS[class_id]
-            detections.append(detection)
+    for class_id, (y_min, x_min, y_max, x_max, score) in zip(
+        class_ids.tolist(), rows.tolist()
+    ):
+        detection: dict[str, Any] = {
+            "class_id": class_id,
+            "confidence": score,
+            "bbox": {
+                "x_min": x_min,
+                "y_min": y_min,
+                "x_max": x_max,
+                "y_max": y_max,
+            },
+        }
+        if class_id < len(COCO_LABELS):
+            detection["label"] = COCO_LABELS[class_id]
+        detections.append(detection)
     return detections
 
 
-def _class_box_arrays(buffer: Any) -> Iterable[np.ndarray] | None:
+def _select_boxes(
+    buffer: Any, score_threshold: float
+) -> tuple[np.ndarray, np.ndarray] | None:
+    """Return class IDs and ``(N, 5)`` rows for boxes that pass the score mask.
+
+    Masking happens on the whole NMS tensor at once, so the zero-padded slots
+    never reach Python.
+    """
+    class_boxes = _class_box_arrays(buffer)
+    if class_boxes is None:
+        return None
+
+    if isinstance(class_boxes, np.ndarray):
+        keep = _score_mask(class_boxes[..., 4], score_threshold)
+        class_ids, _ = np.nonzero(keep)
+        return class_ids, class_boxes[keep]
+
+    if not class_boxes:
+        return np.empty(0, dtype=np.intp), np.empty((0, 5))
+    counts = [len(boxes) for boxes in class_boxes]
+    class_ids = np.repeat(np.arange(len(class_boxes)), counts)
+    rows = np.concatenate(class_boxes)
+    keep = _score_mask(rows[:, 4], score_threshold)
+    return class_ids[keep], rows[keep]
+
+
+def _score_mask(scores: np.ndarray, score_threshold: float) -> np.ndarray:
+    with np.errstate(invalid="ignore"):
+        return np.isfinite(scores) & (scores > 0.0) & (scores >= score_threshold)
+
+
+def _class_box_arrays(buffer: Any) -> np.ndarray | list[np.ndarray] | None:
     """Normalize NMS output to one ``(detections, 5)`` array per class."""
     if isinstance(buffer, (list, tuple)):
         arrays = [np.asarray(item) for item in buffer]
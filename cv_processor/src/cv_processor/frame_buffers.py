@@ -0,0 +1,108 @@
+"""Preallocated frame buffers reused across captures and inference inputs."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Optional
+
+import cv2
+import numpy as np
+
+COLOR_ORDERS = ("bgr", "rgb")
+
+
+class FrameRing:
+    """Fixed ring of arrays handed out round-robin.
+
+    Slots are allocated lazily from the first frame's shape and dtype. A slot
+    is rewritten ``slots`` calls after it was handed out, so the ring must be
+    larger than the number of frames that can be alive downstream at once.
+    """
+
+    def __init__(self, slots: int) -> None:
+        if slots < 1:
+            raise ValueError("slots must be >= 1")
+        self._slots = slots
+        self._buffers: list[np.ndarray] = []
+        self._index = 0
+
+    @property
+    def ready(self) -> bool:
+        return bool(self._buffers)
+
+    def reserve(self, shape: tuple[int, ...], dtype: Any) -> None:
+        """Allocate the ring for frames of ``shape``/``dtype`` if needed."""
+        if self._buffers and self._buffers[0].shape == shape and self._buffers[0].dtype == dtype:
+            return
+        self._buffers = [np.empty(shape, dtype=dtype) for _ in range(self._slots)]
+        self._index = 0
+
+    def next(self) -> np.ndarray:
+        buffer = self._buffers[self._index]
+        self._index = (self._index + 1) % self._slots
+        return buffer
+
+
+class FramePool:
+    """Fixed set of arrays that are checked out and returned explicitly.
+
+    Used for inference inputs, whose lifetime ends in an asynchronous callback
+    rather than after a fixed number of frames. When every slot is checked out
+    a temporary array is returned instead and counted in ``misses``.
+    """
+
+    def __init__(self, slots: int) -> None:
+        if slots < 1:
+            raise ValueError("slots must be >= 1")
+        self._slots = slots
+        self._lock = threading.Lock()
+        self._spec: Optional[tuple[tuple[int, ...], np.dtype]] = None
+        self._owned: dict[int, np.ndarray] = {}
+        self._free: list[np.ndarray] = []
+        self.misses = 0
+
+    def acquire(self, shape: tuple[int, ...], dtype: Any) -> np.ndarray:
+        spec = (tuple(shape), np.dtype(dtype))
+        with self._lock:
+            if spec != self._spec:
+                self._spec = spec
+                self._free = [np.empty(shape, dtype=dtype) for _ in range(self._slots)]
+                self._owned = {id(buffer): buffer for buffer in self._free}
+            if self._free:
+                return self._free.pop()
+            self.misses += 1
+        return np.empty(shape, dtype=dtype)
+
+    def release(self, buffer: Any) -> None:
+        """Return ``buffer`` to the pool; arrays the pool does not own are ignored."""
+        with self._lock:
+            if self._owned.get(id(buffer)) is buffer:
+                self._free.append(buffer)
+
+
+def read_frame(capture: Any, ring: Optional[FrameRing]) -> tuple[bool, Any]:
+    """Read from ``capture``, decoding into the next ring slot when possible."""
+    if ring is None or not ring.ready:
+        ok, frame = capture.read()
+        if ok and ring is not None and isinstance(frame, np.ndarray):
+            ring.reserve(frame.shape, frame.dtype)
+        return ok, frame
+    return capture.read(ring.next())
+
+
+def resize_into(
+    frame: np.ndarray,
+    dst: np.ndarray,
+    *,
+    color_order: str = "bgr",
+) -> np.ndarray:
+    """Resize ``frame`` into ``dst`` and convert BGR to RGB in place if asked.
+
+    The colour swap runs on the model-sized output rather than the full camera
+    frame, and neither step allocates.
+    """
+    height, width = dst.shape[:2]
+    cv2.resize(frame, (width, height), dst=dst)
+    if color_order == "rgb":
+        cv2.cvtColor(dst, cv2.COLOR_BGR2RGB, dst=dst)
+    return dst
@@ -0,0 +1,77 @@
+"""Cheap scene-change detection used to skip inference on static frames."""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import cv2
+import numpy as np
+
+
+class MotionGate:
+    """Decides whether a frame differs enough from the last inferred one.
+
+    Each frame is shrunk to a ``thumbnail_size`` grayscale copy and scored by
+    the mean absolute difference (0-255) against the thumbnail of the last
+    frame that went to inference. Comparing against that reference rather
+    than the previous frame means slow drift still accumulates into a
+    refresh. Inference is also forced once every ``refresh_interval`` gated
+    frames so carried-forward results cannot go stale indefinitely.
+    """
+
+    def __init__(
+        self,
+        threshold: float,
+        *,
+        refresh_interval: int = 30,
+        thumbnail_size: tuple[int, int] = (64, 48),
+    ) -> None:
+        if threshold < 0:
+            raise ValueError("threshold must be >= 0")
+        if refresh_interval < 1:
+            raise ValueError("refresh_interval must be >= 1")
+        self.threshold = threshold
+        self.refresh_interval = refresh_interval
+        self._thumbnail_size = thumbnail_size
+        width, height = thumbnail_size
+        self._small: Optional[np.ndarray] = None
+        self._gray = np.empty((height, width), dtype=np.uint8)
+        self._reference = np.empty((height, width), dtype=np.uint8)
+        self._diff = np.empty((height, width), dtype=np.uint8)
+        self._has_reference = False
+        self._since_inference = 0
+        self.last_score: Optional[float] = None
+
+    def should_infer(self, frame: Any) -> bool:
+        """Score ``frame`` and return ``True`` if it should go to inference."""
+        if not isinstance(frame, np.ndarray):
+            return True
+        gray = self._thumbnail(frame)
+        if self._has_reference:
+            cv2.absdiff(gray, self._reference, dst=self._diff)
+            self.last_score = float(cv2.mean(self._diff)[0])
+        else:
+            self.last_score = None
+        self._since_inference += 1
+        if (
+            self._has_reference
+            and self.last_score < self.threshold
+            and self._since_inference < self.refresh_interval
+        ):
+            return False
+        np.copyto(self._reference, gray)
+        self._has_reference = True
+        self._since_inference = 0
+        return True
+
+    def _thumbnail(self, frame: np.ndarray) -> np.ndarray:
+        width, height = self._thumbnail_size
+        if frame.ndim == 2:
+            cv2.resize(frame, (width, height), dst=self._gray, interpolation=cv2.INTER_AREA)
+            return self._gray
+        shape = (height, width, frame.shape[2])
+        if self._small is None or self._small.shape != shape or self._small.dtype != frame.dtype:
+            self._small = np.empty(shape, dtype=frame.dtype)
+        cv2.resize(frame, (width, height), dst=self._small, interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(self._small, cv2.COLOR_BGR2GRAY, dst=self._gray)
+        return self._gray
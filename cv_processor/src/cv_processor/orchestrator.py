@@ -4,22 +4,66 @@ from __future__ import annotations
 
 import json
 import logging
-from queue import Empty, Queue
-from time import time
-from typing import Any, Optional
-
-import cv2
+import threading
+from dataclasses import dataclass
+from queue import Empty, Full, Queue
+from time import monotonic, time
+from typing import Any, Callable, Iterator, Optional
 
 from sundew_common.ipc_client import ZmqIpcClient
+from sundew_common.latency import LatencyRecorder
+from sundew_common.queues import BLOCK, DROP_NEWEST, DROP_OLDEST, DropQueue
 
-from .camera_client import CameraClient
+from .batching import BatchAssembler, split_bindings
+from .camera_client import CameraClient, CapturedFrame
 from .detection_serializer import serialize_detections
+from .frame_buffers import COLOR_ORDERS, FramePool, resize_into
 from .hailo_infer_client import HailoInferClient
+from .motion_gate import MotionGate
+from .stride_controller import StrideController
 
 logger = logging.getLogger(__name__)
 
+
+@dataclass
+class _FramePacket:
+    """Work item handed between pipeline stages, with its stage timings."""
+
+    frame_id: int
+    payload: Any
+    stride: int = 1
+    captured_at: float = 0.0
+    capture_timestamp_ms: int = 0
+    resize_ms: float = 0.0
+    inference_ms: Optional[float] = None
+    carried: bool = False
+    motion_score: Optional[float] = None
+
+
 class CvOrchestrator:
-    """Builds and runs the CV pipeline."""
+    """Builds and runs the CV pipeline.
+
+    Frames flow camera -> preprocess -> inference -> postprocess, each stage on
+    its own thread and connected by bounded queues. The preprocess stage
+    resizes frames, the inference stage only submits work to Hailo, and the
+    postprocess stage serializes and emits results delivered by the inference
+    callbacks, so the accelerator is never waiting on Python-side work.
+
+    With ``adaptive_stride`` the number of skipped frames follows measured
+    inference latency, queue occupancy and in-flight work; each message
+    reports the stride that was in effect for its frame.
+
+    With ``motion_threshold`` set, a motion gate between the camera and the
+    inference stage skips Hailo work on frames that barely changed and emits
+    the previous detections instead, tagged ``result_source: carried_forward``.
+
+    Every message carries the capture timestamp and per-stage timings, which
+    are also kept in rolling histograms reported by ``dump_stats``.
+
+    Model inputs are resized (and colour converted) into a fixed pool of
+    preallocated buffers that return to the pool when their inference
+    callback fires.
+    """
 
     def __init__(
         self,
@@ -30,16 +74,33 @@ class CvOrchestrator:
         ipc_socket_type: str = "PUB",
         camera_index: int = 0,
         queue_maxsize: int = 4,
+        frame_queue_policy: str = DROP_NEWEST,
         output_console: bool = False,
         frame_stride: int = 1,
+        adaptive_stride: bool = False,
+        min_stride: int = 1,
+        max_stride: int = 8,
+        target_latency_ms: float = 100.0,
+        motion_threshold: Optional[float] = None,
+        motion_refresh_interval: int = 30,
         resize_width: int = 640,
         resize_height: int = 640,
+        input_color: str = "bgr",
+        input_buffer_slots: Optional[int] = None,
+        batch_max_wait_ms: float = 20.0,
+        infer_queue_maxsize: int = 2,
+        infer_queue_policy: str = DROP_OLDEST,
+        result_queue_maxsize: int = 8,
+        result_queue_policy: str = BLOCK,
+        stats_interval_s: Optional[float] = None,
         frame_queue: Optional[Queue] = None,
         camera_client: Optional[CameraClient] = None,
         infer_client: Optional[HailoInferClient] = None,
         ipc_client: Optional[ZmqIpcClient] = None,
     ) -> None:
-        self._frame_queue = frame_queue or Queue(maxsize=queue_maxsize)
+        if frame_queue_policy == BLOCK:
+            raise ValueError("frame_queue_policy must drop frames; capture cannot block")
+        self._frame_queue = frame_queue or DropQueue(queue_maxsize, frame_queue_policy)
         self._camera_client = camera_client or CameraClient(
             self._frame_queue, camera_index=camera_index
         )
@@ -54,64 +115,265 @@ class CvOrchestrator:
             self._ipc_client = ipc_client or ZmqIpcClient(
                 ipc_endpoint, ipc_socket_type
             )
-        if frame_stride < 1:
-            raise ValueError("frame_stride must be >= 1")
-        self._frame_stride = frame_stride
+        self._stride = StrideController(
+            frame_stride,
+            adaptive=adaptive_stride,
+            min_stride=min_stride,
+            max_stride=max_stride,
+            target_latency_ms=target_latency_ms,
+            max_in_flight=2 * batch_size,
+        )
+        self._motion_gate = (
+            MotionGate(motion_threshold, refresh_interval=motion_refresh_interval)
+            if motion_threshold is not None
+            else None
+        )
         if resize_width < 1 or resize_height < 1:
             raise ValueError("resize_width/resize_height must be >= 1")
         self._resize_width = resize_width
         self._resize_height = resize_height
+        if input_color not in COLOR_ORDERS:
+            raise ValueError(f"input_color must be one of {COLOR_ORDERS}")
+        self._input_color = input_color
+        if input_buffer_slots is None:
+            # Queued frames, the batch being assembled and one batch in flight.
+            input_buffer_slots = infer_queue_maxsize + 2 * batch_size
+        self._input_pool = FramePool(input_buffer_slots)
+        self._batcher = BatchAssembler(batch_size, batch_max_wait_ms)
+        self._infer_queue = DropQueue(
+            infer_queue_maxsize, infer_queue_policy, on_drop=self._release_input
+        )
+        self._result_queue = DropQueue(result_queue_maxsize, result_queue_policy)
+        self._latency = LatencyRecorder()
+        self._stats_interval_s = stats_interval_s
+        self._next_stats_at: Optional[float] = None
+        self._last_detections: list[dict[str, Any]] = []
         self._frame_id = 0
+        self._last_processed_id: Optional[int] = None
+        self._in_flight = 0
+        self._in_flight_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._abort_event = threading.Event()
+        self._stage_error: Optional[BaseException] = None
 
     def run(self, *, max_frames: Optional[int] = None) -> None:
-        """Start the camera and run inference, sending results to IPC."""
-        processed = 0
+        """Start the camera and pipeline stages, sending results to IPC.
+
+        Returns once ``max_frames`` frames have been submitted and every stage
+        has drained, or re-raises the first error raised by a stage.
+        """
+        self._stop_event.clear()
+        self._abort_event.clear()
+        self._stage_error = None
         self._camera_client.start()
+        preprocess = self._start_stage("cv-preprocess", self._preprocess_loop, max_frames)
+        inference = self._start_stage("cv-inference", self._inference_loop, preprocess)
+        postprocess = self._start_stage("cv-postprocess", self._postprocess_loop, inference)
         logger.info("CV orchestrator run loop started")
         try:
-            while True:
-                try:
-                    frame = self._frame_queue.get(timeout=0.5)
-                except Empty:
-                    continue
-                if self._frame_id % self._frame_stride != 0:
-                    self._frame_id += 1
-                    continue
-                callback = self._build_callback(self._frame_id)
-                # TO-DO: call inference on a different thread to improve throughput.
-                resized = self._resize_frame(frame)
-                self._infer_client.run([resized], callback)
-                self._frame_id += 1
-                processed += 1
-                if max_frames is not None and processed >= max_frames:
-                    logger.info("Reached max_frames=%s, stopping", max_frames)
-                    break
+            while preprocess.is_alive():
+                preprocess.join(timeout=0.5)
         finally:
+            self._stop_event.set()
             self._camera_client.stop()
+            for stage in (preprocess, inference, postprocess):
+                stage.join()
             self._infer_client.close()
             if self._ipc_client is not None:
                 self._ipc_client.close()
-            logger.info("CV orchestrator shut down")
+            logger.info(
+                "CV orchestrator shut down (frames_consumed=%s, frames_evicted=%s, "
+                "infer_dropped=%s, result_dropped=%s)",
+                getattr(self._frame_queue, "consumed", None),
+                getattr(self._frame_queue, "dropped", None),
+                self._infer_queue.dropped,
+                self._result_queue.dropped,
+            )
+        if self._stage_error is not None:
+            raise self._stage_error
 
-    def _build_callback(self, frame_id: int):
-        def _callback(completion_info: Any, bindings_list: Any) -> None:
-            message = {
-                "schema_version": "1.0",
-                "timestamp_ms": int(time() * 1000),
-                "frame_id": frame_id,
-                "source": "camera-0",
-                "model": "hailo-object-detect-v1",
-                "detections": serialize_detections(bindings_list),
-                "processing": {
-                    "frame_stride": self._frame_stride,
-                    "inference_ms": None,
-                    "postprocess_ms": None,
-                },
-            }
+    def _start_stage(
+        self, name: str, target: Callable[..., None], *args: Any
+    ) -> threading.Thread:
+        def _run() -> None:
+            try:
+                target(*args)
+            except BaseException as exc:
+                logger.exception("Pipeline stage %s failed", name)
+                if self._stage_error is None:
+                    self._stage_error = exc
+                self._abort_event.set()
+                self._stop_event.set()
+
+        thread = threading.Thread(target=_run, name=name)
+        thread.start()
+        return thread
+
+    def _preprocess_loop(self, max_frames: Optional[int]) -> None:
+        processed = 0
+        while not self._stop_event.is_set():
+            try:
+                item = self._frame_queue.get(timeout=0.5)
+            except Empty:
+                continue
+            frame_id = self._frame_id
+            self._frame_id += 1
+            stride = self._stride.stride
+            if (
+                self._last_processed_id is not None
+                and frame_id - self._last_processed_id < stride
+            ):
+                continue
+            self._last_processed_id = frame_id
+            queue, packet = self._prepare_packet(frame_id, stride, item)
+            self._offer(queue, packet)
+            processed += 1
+            if max_frames is not None and processed >= max_frames:
+                logger.info("Reached max_frames=%s, stopping", max_frames)
+                break
+
+    def _prepare_packet(
+        self, frame_id: int, stride: int, item: Any
+    ) -> tuple[DropQueue, _FramePacket]:
+        """Build the packet for a selected frame and pick the queue it goes to.
+
+        Frames the motion gate rejects bypass inference and go straight to the
+        result queue as carried-forward packets.
+        """
+        if isinstance(item, CapturedFrame):
+            frame, captured_at, timestamp_ms = item.image, item.captured_at, item.timestamp_ms
+        else:
+            frame, captured_at, timestamp_ms = item, monotonic(), int(time() * 1000)
+        packet = _FramePacket(frame_id, None, stride, captured_at, timestamp_ms)
+        if self._motion_gate is not None:
+            fresh = self._motion_gate.should_infer(frame)
+            packet.motion_score = self._motion_gate.last_score
+            if not fresh:
+                packet.carried = True
+                return self._result_queue, packet
+        started = monotonic()
+        packet.payload = self._preprocess_frame(frame)
+        packet.resize_ms = (monotonic() - started) * 1000
+        return self._infer_queue, packet
+
+    def _inference_loop(self, upstream: threading.Thread) -> None:
+        for first in self._drain(self._infer_queue, upstream):
+            batch = self._batcher.collect(first, self._infer_queue)
+            with self._in_flight_lock:
+                self._in_flight += len(batch)
+            self._infer_client.run(
+                [packet.payload for packet in batch],
+                self._build_callback(batch),
+            )
+
+    def _postprocess_loop(self, upstream: threading.Thread) -> None:
+        if self._stats_interval_s:
+            self._next_stats_at = monotonic() + self._stats_interval_s
+        for packet in self._drain(self._result_queue, upstream):
+            message = self._build_message(packet)
             self._emit_message(message)
+            self._record_latency(packet, message)
+
+    def dump_stats(self) -> dict[str, Any]:
+        """Log and return p50/p95/p99 latency per pipeline stage."""
+        summary = self._latency.summary()
+        logger.info("CV pipeline latency (ms): %s", json.dumps(summary))
+        return summary
+
+    def _drain(self, queue: Queue, upstream: threading.Thread) -> Iterator[Any]:
+        """Yield queued items until ``upstream`` has exited and ``queue`` is empty."""
+        while not self._abort_event.is_set():
+            try:
+                yield queue.get(timeout=0.1)
+            except Empty:
+                if not upstream.is_alive() and queue.empty():
+                    return
+
+    def _offer(self, queue: DropQueue, item: Any) -> None:
+        # Blocking queues wait in short slices so a failed stage cannot wedge us.
+        while not self._abort_event.is_set():
+            try:
+                queue.offer(item, timeout=0.1)
+                return
+            except Full:
+                continue
+
+    def _build_callback(self, batch: list[_FramePacket]):
+        submitted = monotonic()
+
+        def _callback(completion_info: Any, bindings_list: Any) -> None:
+            inference_ms = (monotonic() - submitted) * 1000
+            with self._in_flight_lock:
+                self._in_flight -= len(batch)
+                in_flight = self._in_flight
+            self._stride.observe(
+                inference_ms=inference_ms,
+                queue_occupancy=self._queue_occupancy(),
+                in_flight=in_flight,
+            )
+            for packet in batch:
+                self._release_input(packet)
+            per_frame = split_bindings(bindings_list, len(batch))
+            if per_frame is None:
+                logger.error(
+                    "Dropping results for frames %s: expected %s bindings",
+                    [packet.frame_id for packet in batch],
+                    len(batch),
+                )
+                return
+            for packet, bindings in zip(batch, per_frame):
+                packet.payload = bindings
+                packet.inference_ms = inference_ms
+                self._offer(self._result_queue, packet)
 
         return _callback
 
+    def _queue_occupancy(self) -> float:
+        """Fill level of the fullest bounded queue ahead of inference."""
+        occupancy = 0.0
+        for queue in (self._frame_queue, self._infer_queue):
+            if queue.maxsize > 0:
+                occupancy = max(occupancy, queue.qsize() / queue.maxsize)
+        return occupancy
+
+    def _build_message(self, packet: _FramePacket) -> dict[str, Any]:
+        started = monotonic()
+        if packet.carried:
+            detections = self._last_detections
+        else:
+            detections = self._last_detections = serialize_detections(packet.payload)
+        postprocess_ms = (monotonic() - started) * 1000
+        message = {
+            "schema_version": "1.0",
+            "timestamp_ms": int(time() * 1000),
+            "capture_timestamp_ms": packet.capture_timestamp_ms,
+            "frame_id": packet.frame_id,
+            "source": "camera-0",
+            "model": "hailo-object-detect-v1",
+            "detections": detections,
+            "processing": {
+                "frame_stride": packet.stride,
+                "resize_ms": round(packet.resize_ms, 3),
+                "inference_ms": _round_ms(packet.inference_ms),
+                "postprocess_ms": round(postprocess_ms, 3),
+                "result_source": "carried_forward" if packet.carried else "inference",
+            },
+        }
+        if packet.motion_score is not None:
+            message["processing"]["motion_score"] = round(packet.motion_score, 3)
+        return message
+
+    def _record_latency(self, packet: _FramePacket, message: dict[str, Any]) -> None:
+        processing = message["processing"]
+        if not packet.carried:
+            self._latency.record("resize", processing["resize_ms"])
+        self._latency.record("inference", processing["inference_ms"])
+        self._latency.record("postprocess", processing["postprocess_ms"])
+        self._latency.record("capture_to_emit", (monotonic() - packet.captured_at) * 1000)
+        if self._next_stats_at is not None and monotonic() >= self._next_stats_at:
+            self._next_stats_at = monotonic() + self._stats_interval_s
+            self.dump_stats()
+
     def _emit_message(self, message: dict[str, Any]) -> None:
         if self._output_console:
             print(json.dumps(message), flush=True)
@@ -120,7 +382,16 @@ class CvOrchestrator:
             raise RuntimeError("IPC client unavailable for message emit")
         self._ipc_client.send_json(message)
 
-    def _resize_frame(self, frame: Any) -> Any:
+    def _preprocess_frame(self, frame: Any) -> Any:
         if frame is None or not hasattr(frame, "shape"):
             return frame
-        return cv2.resize(frame, (self._resize_width, self._resize_height))
+        shape = (self._resize_height, self._resize_width) + tuple(frame.shape[2:])
+        dst = self._input_pool.acquire(shape, frame.dtype)
+        return resize_into(frame, dst, color_order=self._input_color)
+
+    def _release_input(self, packet: _FramePacket) -> None:
+        self._input_pool.release(packet.payload)
+
+
+def _round_ms(value: Optional[float]) -> Optional[float]:
+    return None if value is None else round(value, 3)
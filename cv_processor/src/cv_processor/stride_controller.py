@@ -0,0 +1,97 @@
+"""Frame stride selection driven by measured pipeline load."""
+
+from __future__ import annotations
+
+import threading
+from typing import Optional
+
+
+class StrideController:
+    """Chooses how many camera frames to skip between inferences.
+
+    A fixed controller always returns ``initial_stride``. An adaptive one
+    keeps an exponentially weighted average of inference latency and, at most
+    once every ``cooldown`` observations, raises the stride when the pipeline
+    is overloaded (latency above ``target_latency_ms``, queues filling up or
+    too many frames in flight) and lowers it once latency falls well below
+    the target with the queues empty. The stride stays within
+    ``[min_stride, max_stride]``.
+    """
+
+    def __init__(
+        self,
+        initial_stride: int = 1,
+        *,
+        adaptive: bool = False,
+        min_stride: int = 1,
+        max_stride: int = 8,
+        target_latency_ms: float = 100.0,
+        max_in_flight: int = 2,
+        smoothing: float = 0.2,
+        cooldown: int = 5,
+    ) -> None:
+        if min_stride < 1 or max_stride < min_stride:
+            raise ValueError("expected 1 <= min_stride <= max_stride")
+        if initial_stride < 1:
+            raise ValueError("frame_stride must be >= 1")
+        if target_latency_ms <= 0:
+            raise ValueError("target_latency_ms must be greater than zero")
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be in (0, 1]")
+        self.adaptive = adaptive
+        self.min_stride = min_stride
+        self.max_stride = max_stride
+        self.target_latency_ms = target_latency_ms
+        self.max_in_flight = max_in_flight
+        self._smoothing = smoothing
+        self._cooldown = cooldown
+        self._stride = (
+            min(max(initial_stride, min_stride), max_stride) if adaptive else initial_stride
+        )
+        self._latency_ms: Optional[float] = None
+        self._since_change = 0
+        self._lock = threading.Lock()
+
+    @property
+    def stride(self) -> int:
+        return self._stride
+
+    @property
+    def latency_ms(self) -> Optional[float]:
+        """Smoothed inference latency, once at least one sample was observed."""
+        return self._latency_ms
+
+    def observe(
+        self,
+        *,
+        inference_ms: Optional[float] = None,
+        queue_occupancy: float = 0.0,
+        in_flight: int = 0,
+    ) -> int:
+        """Record one load sample and return the stride to use next."""
+        if not self.adaptive:
+            return self._stride
+        with self._lock:
+            if inference_ms is not None:
+                if self._latency_ms is None:
+                    self._latency_ms = inference_ms
+                else:
+                    self._latency_ms += self._smoothing * (inference_ms - self._latency_ms)
+            self._since_change += 1
+            if self._since_change < self._cooldown:
+                return self._stride
+
+            latency = self._latency_ms or 0.0
+            overloaded = (
+                latency > self.target_latency_ms
+                or queue_occupancy >= 0.75
+                or in_flight > self.max_in_flight
+            )
+            idle = latency < 0.5 * self.target_latency_ms and queue_occupancy == 0.0
+            if overloaded and self._stride < self.max_stride:
+                self._stride += 1
+                self._since_change = 0
+            elif idle and not overloaded and self._stride > self.min_stride:
+                self._stride -= 1
+                self._since_change = 0
+            return self._stride
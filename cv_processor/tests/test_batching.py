@@ -0,0 +1,36 @@
+from queue import Queue
+
+import pytest
+
+from cv_processor.batching import BatchAssembler, split_bindings
+
+
+def test_collect_fills_batch_from_queue():
+    queue = Queue()
+    for item in ("b", "c", "d"):
+        queue.put(item)
+
+    batch = BatchAssembler(3, max_wait_ms=50).collect("a", queue)
+
+    assert batch == ["a", "b", "c"]
+    assert queue.get_nowait() == "d"
+
+
+def test_collect_flushes_partial_batch_after_deadline():
+    queue = Queue()
+    queue.put("b")
+
+    batch = BatchAssembler(4, max_wait_ms=5).collect("a", queue)
+
+    assert batch == ["a", "b"]
+
+
+def test_split_bindings_matches_frames():
+    assert split_bindings(["x"], 1) == [["x"]]
+    assert split_bindings(["x", "y"], 2) == ["x", "y"]
+    assert split_bindings(["x"], 2) is None
+
+
+def test_invalid_batch_size_is_rejected():
+    with pytest.raises(ValueError):
+        BatchAssembler(0, max_wait_ms=1)
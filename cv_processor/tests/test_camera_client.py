@@ -1,5 +1,7 @@
 from queue import Queue
 
+from sundew_common.queues import DROP_OLDEST, DropQueue
+
 from cv_processor.camera_client import CameraClient
 
 
@@ -32,3 +34,20 @@ def test_camera_client_enqueues_frames_and_releases():
 
     assert queue.qsize() == 2
     assert capture.released is True
+    first = queue.get_nowait()
+    assert first.image == "f1"
+    assert first.captured_at > 0
+    assert first.timestamp_ms > 0
+
+
+def test_camera_client_keeps_latest_frames_with_drop_oldest_queue():
+    capture = FakeCapture(["f1", "f2", "f3"])
+    queue = DropQueue(1, DROP_OLDEST)
+
+    client = CameraClient(queue, capture_factory=lambda _: capture)
+    client.start()
+    client.stop(timeout=1.0)
+
+    assert queue.get_nowait().image == "f3"
+    assert queue.dropped == 2
+    assert queue.consumed == 1
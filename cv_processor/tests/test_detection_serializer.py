@@ -115,3 +115,35 @@ def test_serialize_detections_describes_unsupported_output_without_dumping_it():
 def test_json_safe_handles_numpy_values():
     assert json_safe(np.float32(0.5)) == 0.5
     assert json_safe(np.array([1, 2])) == [1, 2]
+
+
+def test_serialize_detections_masks_padding_and_applies_threshold():
+    nms = np.zeros((3, 4, 5), dtype=np.float32)
+    nms[0, 2] = [0.1, 0.1, 0.5, 0.5, 0.4]
+    nms[2, 0] = [0.2, 0.2, 0.6, 0.6, 0.8]
+    nms[2, 1] = [0.2, 0.2, 0.6, 0.6, np.nan]
+    bindings = FakeBindings({"nms": nms})
+
+    assert [d["class_id"] for d in serialize_detections([bindings])] == [0, 2]
+    result = serialize_detections([bindings], score_threshold=0.5)
+
+    assert len(result) == 1
+    assert result[0]["class_id"] == 2
+    assert result[0]["label"] == "car"
+    assert result[0]["confidence"] == pytest.approx(0.8)
+
+
+def test_serialize_detections_supports_ragged_per_class_lists():
+    per_class = [
+        np.empty((0, 5), dtype=np.float32),
+        np.array([[0.1, 0.2, 0.3, 0.4, 0.6], [0, 0, 0, 0, 0]], dtype=np.float32),
+    ]
+    bindings = FakeBindings({"nms": per_class})
+
+    result = serialize_detections([bindings])
+
+    assert len(result) == 1
+    assert result[0]["class_id"] == 1
+    assert result[0]["bbox"] == pytest.approx(
+        {"x_min": 0.2, "y_min": 0.1, "x_max": 0.4, "y_max": 0.3}
+    )
@@ -0,0 +1,53 @@
+import numpy as np
+
+from cv_processor.frame_buffers import FramePool, FrameRing, read_frame, resize_into
+
+
+class BufferedCapture:
+    def __init__(self, frames):
+        self._frames = list(frames)
+        self.targets = []
+
+    def read(self, image=None):
+        self.targets.append(image)
+        frame = self._frames.pop(0)
+        if image is None:
+            return True, frame.copy()
+        image[...] = frame
+        return True, image
+
+
+def test_read_frame_reuses_ring_slots_after_first_read():
+    frames = [np.full((4, 6, 3), value, dtype=np.uint8) for value in range(4)]
+    capture = BufferedCapture(frames)
+    ring = FrameRing(2)
+
+    results = [read_frame(capture, ring)[1] for _ in range(4)]
+
+    assert capture.targets[0] is None
+    assert results[1] is results[3]
+    assert results[1] is not results[2]
+    assert int(results[3][0, 0, 0]) == 3
+
+
+def test_frame_pool_recycles_released_buffers_and_counts_misses():
+    pool = FramePool(1)
+
+    first = pool.acquire((2, 2, 3), np.uint8)
+    spare = pool.acquire((2, 2, 3), np.uint8)
+    pool.release(first)
+    pool.release(spare)
+
+    assert pool.misses == 1
+    assert pool.acquire((2, 2, 3), np.uint8) is first
+
+
+def test_resize_into_converts_to_rgb_in_place():
+    frame = np.zeros((8, 8, 3), dtype=np.uint8)
+    frame[..., 0] = 255  # blue in BGR
+    dst = np.empty((4, 4, 3), dtype=np.uint8)
+
+    result = resize_into(frame, dst, color_order="rgb")
+
+    assert result is dst
+    assert dst[0, 0].tolist() == [0, 0, 255]
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from cv_processor.motion_gate import MotionGate
+
+
+def frame(value):
+    return np.full((120, 160, 3), value, dtype=np.uint8)
+
+
+def test_gate_skips_static_frames_and_passes_changes():
+    gate = MotionGate(threshold=5.0)
+
+    assert gate.should_infer(frame(10)) is True
+    assert gate.should_infer(frame(12)) is False
+    assert gate.last_score == pytest.approx(2.0)
+    assert gate.should_infer(frame(40)) is True
+
+
+def test_gate_compares_against_last_inferred_frame():
+    gate = MotionGate(threshold=5.0)
+    gate.should_infer(frame(10))
+
+    assert gate.should_infer(frame(13)) is False
+    assert gate.should_infer(frame(16)) is True
+
+
+def test_gate_forces_periodic_refresh():
+    gate = MotionGate(threshold=5.0, refresh_interval=2)
+
+    results = [gate.should_infer(frame(10)) for _ in range(5)]
+
+    assert results == [True, False, True, False, True]
+
+
+def test_gate_passes_non_image_frames():
+    assert MotionGate(threshold=5.0).should_infer("frame") is True
@@ -1,6 +1,11 @@
 import json
 from queue import Queue
+from time import monotonic
 
+import numpy as np
+import pytest
+
+from cv_processor.camera_client import CapturedFrame
 from cv_processor.orchestrator import CvOrchestrator
 
 
@@ -94,3 +99,204 @@ def test_orchestrator_outputs_to_console_when_enabled(capsys):
     payload = json.loads(output)
     assert payload["frame_id"] == 0
     assert payload["detections"] == [{"detections": 1}]
+
+
+def test_orchestrator_applies_frame_stride():
+    queue = Queue()
+    for index in range(5):
+        queue.put(f"frame-{index}")
+
+    infer = FakeInferClient()
+    ipc = FakeIpcClient()
+
+    orchestrator = CvOrchestrator(
+        network="net.hef",
+        batch_size=1,
+        ipc_endpoint="ipc:///tmp/sundew.ipc",
+        frame_stride=2,
+        infer_queue_policy="block",
+        frame_queue=queue,
+        camera_client=FakeCameraClient(),
+        infer_client=infer,
+        ipc_client=ipc,
+    )
+
+    orchestrator.run(max_frames=3)
+
+    assert infer.runs == [["frame-0"], ["frame-2"], ["frame-4"]]
+    assert [message["frame_id"] for message in ipc.messages] == [0, 2, 4]
+
+
+def test_orchestrator_reraises_stage_errors_and_shuts_down():
+    class FailingInferClient(FakeInferClient):
+        def run(self, batch, callback):
+            raise RuntimeError("hailo failure")
+
+    queue = Queue()
+    queue.put("frame-1")
+    camera = FakeCameraClient()
+    infer = FailingInferClient()
+    ipc = FakeIpcClient()
+
+    orchestrator = CvOrchestrator(
+        network="net.hef",
+        batch_size=1,
+        ipc_endpoint="ipc:///tmp/sundew.ipc",
+        frame_queue=queue,
+        camera_client=camera,
+        infer_client=infer,
+        ipc_client=ipc,
+    )
+
+    with pytest.raises(RuntimeError, match="hailo failure"):
+        orchestrator.run()
+
+    assert camera.stopped is True
+    assert infer.closed is True
+    assert ipc.closed is True
+
+
+def test_orchestrator_batches_frames_and_splits_results():
+    class BatchInferClient(FakeInferClient):
+        def run(self, batch, callback):
+            self.runs.append(batch)
+            callback("ok", [{"frame": frame} for frame in batch])
+
+    queue = Queue()
+    for index in range(4):
+        queue.put(f"frame-{index}")
+
+    infer = BatchInferClient()
+    ipc = FakeIpcClient()
+
+    orchestrator = CvOrchestrator(
+        network="net.hef",
+        batch_size=2,
+        ipc_endpoint="ipc:///tmp/sundew.ipc",
+        batch_max_wait_ms=1000,
+        infer_queue_maxsize=4,
+        infer_queue_policy="block",
+        frame_queue=queue,
+        camera_client=FakeCameraClient(),
+        infer_client=infer,
+        ipc_client=ipc,
+    )
+
+    orchestrator.run(max_frames=4)
+
+    assert infer.runs == [["frame-0", "frame-1"], ["frame-2", "frame-3"]]
+    assert [message["frame_id"] for message in ipc.messages] == [0, 1, 2, 3]
+    assert ipc.messages[3]["detections"] == [{"frame": "frame-3"}]
+
+
+def test_orchestrator_resizes_into_pooled_buffers():
+    class HoldingInferClient(FakeInferClient):
+        def run(self, batch, callback):
+            self.runs.append(batch[0])
+            callback("ok", [])
+
+    queue = Queue()
+    for _ in range(3):
+        queue.put(np.zeros((480, 640, 3), dtype=np.uint8))
+    infer = HoldingInferClient()
+
+    orchestrator = CvOrchestrator(
+        network="net.hef",
+        batch_size=1,
+        ipc_endpoint="ipc:///tmp/sundew.ipc",
+        resize_width=32,
+        resize_height=24,
+        input_buffer_slots=1,
+        infer_queue_policy="block",
+        frame_queue=queue,
+        camera_client=FakeCameraClient(),
+        infer_client=infer,
+        ipc_client=FakeIpcClient(),
+    )
+
+    orchestrator.run(max_frames=3)
+
+    assert infer.runs[0].shape == (24, 32, 3)
+    assert all(buffer.shape == (24, 32, 3) for buffer in infer.runs)
+
+
+def test_orchestrator_reports_adaptive_stride_in_messages():
+    queue = Queue()
+    for index in range(6):
+        queue.put(f"frame-{index}")
+    ipc = FakeIpcClient()
+
+    orchestrator = CvOrchestrator(
+        network="net.hef",
+        batch_size=1,
+        ipc_endpoint="ipc:///tmp/sundew.ipc",
+        frame_stride=2,
+        adaptive_stride=True,
+        min_stride=2,
+        max_stride=2,
+        infer_queue_policy="block",
+        frame_queue=queue,
+        camera_client=FakeCameraClient(),
+        infer_client=FakeInferClient(),
+        ipc_client=ipc,
+    )
+
+    orchestrator.run(max_frames=3)
+
+    assert [message["frame_id"] for message in ipc.messages] == [0, 2, 4]
+    assert {message["processing"]["frame_stride"] for message in ipc.messages} == {2}
+
+
+def test_orchestrator_reports_stage_timings_and_percentiles():
+    queue = Queue()
+    queue.put(CapturedFrame(np.zeros((48, 64, 3), dtype=np.uint8), monotonic(), 1234))
+    ipc = FakeIpcClient()
+
+    orchestrator = CvOrchestrator(
+        network="net.hef",
+        batch_size=1,
+        ipc_endpoint="ipc:///tmp/sundew.ipc",
+        resize_width=32,
+        resize_height=32,
+        frame_queue=queue,
+        camera_client=FakeCameraClient(),
+        infer_client=FakeInferClient(),
+        ipc_client=ipc,
+    )
+
+    orchestrator.run(max_frames=1)
+
+    message = ipc.messages[0]
+    assert message["capture_timestamp_ms"] == 1234
+    processing = message["processing"]
+    for key in ("resize_ms", "inference_ms", "postprocess_ms"):
+        assert processing[key] >= 0
+    stats = orchestrator.dump_stats()
+    assert set(stats) == {"capture_to_emit", "inference", "postprocess", "resize"}
+    assert stats["inference"]["count"] == 1
+
+
+def test_orchestrator_carries_results_forward_for_static_frames():
+    queue = Queue()
+    for _ in range(3):
+        queue.put(np.full((48, 64, 3), 10, dtype=np.uint8))
+    infer = FakeInferClient()
+    ipc = FakeIpcClient()
+
+    orchestrator = CvOrchestrator(
+        network="net.hef",
+        batch_size=1,
+        ipc_endpoint="ipc:///tmp/sundew.ipc",
+        motion_threshold=5.0,
+        result_queue_maxsize=8,
+        frame_queue=queue,
+        camera_client=FakeCameraClient(),
+        infer_client=infer,
+        ipc_client=ipc,
+    )
+
+    orchestrator.run(max_frames=3)
+
+    assert len(infer.runs) == 1
+    sources = sorted(message["processing"]["result_source"] for message in ipc.messages)
+    assert sources == ["carried_forward", "carried_forward", "inference"]
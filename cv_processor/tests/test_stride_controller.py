@@ -0,0 +1,47 @@
+import pytest
+
+from cv_processor.stride_controller import StrideController
+
+
+def test_fixed_controller_ignores_load():
+    controller = StrideController(3)
+
+    for _ in range(20):
+        controller.observe(inference_ms=1000.0, queue_occupancy=1.0, in_flight=10)
+
+    assert controller.stride == 3
+
+
+def test_adaptive_controller_raises_stride_under_load_within_bounds():
+    controller = StrideController(
+        1, adaptive=True, max_stride=3, target_latency_ms=50.0, cooldown=1
+    )
+
+    for _ in range(10):
+        controller.observe(inference_ms=120.0)
+
+    assert controller.stride == 3
+
+
+def test_adaptive_controller_lowers_stride_when_idle():
+    controller = StrideController(
+        4, adaptive=True, min_stride=2, target_latency_ms=100.0, cooldown=2
+    )
+
+    for _ in range(10):
+        controller.observe(inference_ms=10.0, queue_occupancy=0.0)
+
+    assert controller.stride == 2
+
+
+def test_queue_pressure_counts_as_overload():
+    controller = StrideController(1, adaptive=True, cooldown=1)
+
+    controller.observe(inference_ms=1.0, queue_occupancy=1.0)
+
+    assert controller.stride == 2
+
+
+def test_invalid_bounds_are_rejected():
+    with pytest.raises(ValueError):
+        StrideController(1, adaptive=True, min_stride=4, max_stride=2)
@@ -11,9 +11,11 @@ from time import monotonic, time
 from typing import Any, Callable, Iterable, Optional
 
 import cv2
+import numpy as np
 from flask import Flask, jsonify, request
 
 from cv_processor.detection_serializer import serialize_detections
+from cv_processor.frame_buffers import COLOR_ORDERS, FrameRing, read_frame, resize_into
 from cv_processor.hailo_infer_client import HailoInferClient
 
 logger = logging.getLogger(__name__)
@@ -35,7 +37,11 @@ class DetectionResult:
 
 
 class CameraInferenceService:
-    """Own a camera and Hailo client for synchronous request handling."""
+    """Own a camera and Hailo client for synchronous request handling.
+
+    Requests are serialized, so one capture buffer and one model-input buffer
+    are reused for every call.
+    """
 
     def __init__(
         self,
@@ -43,15 +49,21 @@ class CameraInferenceService:
         *,
         camera_index: int = 0,
         timeout_seconds: float = 10.0,
+        input_color: str = "bgr",
         capture_factory: Optional[Callable[[int], Any]] = None,
         infer_client: Optional[HailoInferClient] = None,
     ) -> None:
         if timeout_seconds <= 0:
             raise ValueError("timeout_seconds must be greater than zero")
+        if input_color not in COLOR_ORDERS:
+            raise ValueError(f"input_color must be one of {COLOR_ORDERS}")
         factory = capture_factory or cv2.VideoCapture
         self._capture = factory(camera_index)
         self._infer_client = infer_client or HailoInferClient(network, batch_size=1)
         self._timeout_seconds = timeout_seconds
+        self._input_color = input_color
+        self._capture_ring = FrameRing(1)
+        self._input_buffer: Optional[np.ndarray] = None
         self._lock = threading.Lock()
         self._closed = False
 
@@ -74,12 +86,14 @@ class CameraInferenceService:
                 raise RuntimeError("Camera inference service is closed")
 
             capture_started = monotonic()
-            ok, frame = self._capture.read()
+            ok, frame = read_frame(self._capture, self._capture_ring)
             capture_ms = (monotonic() - capture_started) * 1000
             if not ok or frame is None:
                 raise CameraCaptureError("Camera did not return a frame")
 
-            resized = cv2.resize(frame, (self._input_width, self._input_height))
+            resized = resize_into(
+                frame, self._input_buffer_for(frame), color_order=self._input_color
+            )
             completed = threading.Event()
             callback_result: dict[str, Any] = {}
 
@@ -107,6 +121,13 @@ class CameraInferenceService:
                 inference_ms=inference_ms,
             )
 
+    def _input_buffer_for(self, frame: np.ndarray) -> np.ndarray:
+        shape = (self._input_height, self._input_width) + tuple(frame.shape[2:])
+        buffer = self._input_buffer
+        if buffer is None or buffer.shape != shape or buffer.dtype != frame.dtype:
+            buffer = self._input_buffer = np.empty(shape, dtype=frame.dtype)
+        return buffer
+
     def close(self) -> None:
         """Release camera and Hailo resources. Safe to call repeatedly."""
         if self._closed:
@@ -207,6 +228,12 @@ def _build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--network", required=True, help="Path to the Hailo HEF")
     parser.add_argument("--camera-index", type=int, default=0)
     parser.add_argument("--timeout-seconds", type=float, default=10.0)
+    parser.add_argument(
+        "--input-color",
+        choices=COLOR_ORDERS,
+        default="bgr",
+        help="Channel order expected by the model; rgb converts camera frames.",
+    )
     parser.add_argument("--model-name", help="Stable model name returned by the API")
     parser.add_argument("--node-name", default="pi-vision-01")
     parser.add_argument("--service-name", default="vision_sundew")
@@ -225,6 +252,7 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
         args.network,
         camera_index=args.camera_index,
         timeout_seconds=args.timeout_seconds,
+        input_color=args.input_color,
     )
     app = create_app(
         service,
@@ -19,7 +19,10 @@ class FakeCapture:
     def isOpened(self):
         return True
 
-    def read(self):
+    def read(self, image=None):
+        if image is not None and self.ok:
+            image[...] = self.frame
+            return self.ok, image
         return self.ok, self.frame
 
     def release(self):
@@ -142,3 +145,28 @@ def test_endpoint_returns_503_when_camera_capture_fails():
 def test_get_is_not_supported():
     app = create_app(MagicMock(), model_name="model.hef")
     assert app.test_client().get("/detect").status_code == 405
+
+
+def test_detect_reuses_capture_and_input_buffers():
+    capture = FakeCapture()
+    infer = MagicMock()
+    infer.get_input_shape.return_value = (320, 320, 3)
+    batches = []
+
+    def run(batch, callback):
+        batches.append(batch[0])
+        callback(MagicMock(exception=None), [])
+
+    infer.run.side_effect = run
+    service = CameraInferenceService(
+        "model.hef",
+        capture_factory=lambda _index: capture,
+        infer_client=infer,
+    )
+
+    service.detect()
+    service.detect()
+    service.detect()
+
+    assert batches[1] is batches[2]
+    assert batches[0] is batches[1]
@@ -0,0 +1,74 @@
+"""Rolling latency histograms for pipeline timing."""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import deque
+from typing import Iterable, Optional
+
+DEFAULT_PERCENTILES = (50, 95, 99)
+
+
+class LatencyHistogram:
+    """Keeps the last ``window`` samples and reports percentiles over them."""
+
+    def __init__(self, window: int = 1024) -> None:
+        if window < 1:
+            raise ValueError("window must be >= 1")
+        self._samples: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def record(self, value_ms: float) -> None:
+        with self._lock:
+            self._samples.append(value_ms)
+            self.count += 1
+
+    def percentiles(
+        self, percentiles: Iterable[float] = DEFAULT_PERCENTILES
+    ) -> dict[str, Optional[float]]:
+        """Return ``{"p50": ..., "p95": ..., ...}`` using nearest-rank."""
+        with self._lock:
+            samples = sorted(self._samples)
+        result: dict[str, Optional[float]] = {}
+        for percentile in percentiles:
+            key = f"p{percentile:g}"
+            if not samples:
+                result[key] = None
+                continue
+            rank = max(math.ceil(percentile / 100 * len(samples)), 1)
+            result[key] = samples[rank - 1]
+        return result
+
+    def summary(self) -> dict[str, Optional[float]]:
+        result: dict[str, Optional[float]] = {"count": self.count}
+        result.update(self.percentiles())
+        return result
+
+
+class LatencyRecorder:
+    """A named set of ``LatencyHistogram`` instances created on first use."""
+
+    def __init__(self, window: int = 1024) -> None:
+        self._window = window
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(
+                    name, LatencyHistogram(self._window)
+                )
+        return histogram
+
+    def record(self, name: str, value_ms: Optional[float]) -> None:
+        if value_ms is not None:
+            self.histogram(name).record(value_ms)
+
+    def summary(self) -> dict[str, dict[str, Optional[float]]]:
+        with self._lock:
+            histograms = dict(self._histograms)
+        return {name: histogram.summary() for name, histogram in sorted(histograms.items())}
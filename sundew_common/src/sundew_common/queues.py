@@ -0,0 +1,73 @@
+"""Bounded queues with explicit overflow policies for pipeline stages."""
+
+from __future__ import annotations
+
+from queue import Queue
+from typing import Any, Callable, Optional
+
+BLOCK = "block"
+DROP_NEWEST = "drop_newest"
+DROP_OLDEST = "drop_oldest"
+OVERFLOW_POLICIES = (BLOCK, DROP_NEWEST, DROP_OLDEST)
+
+
+class DropQueue(Queue):
+    """A ``Queue`` whose ``offer`` applies a drop policy when it is full.
+
+    ``block`` waits for space like ``put``. ``drop_newest`` discards the item
+    being offered and ``drop_oldest`` evicts the head of the queue to make room,
+    so consumers always see the freshest items. ``on_drop`` is called with each
+    discarded item outside the queue lock.
+
+    ``dropped`` counts discarded items and ``consumed`` counts items taken by
+    ``get``; both are updated under the queue lock.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        policy: str = BLOCK,
+        *,
+        on_drop: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Unknown overflow policy {policy!r}; expected one of {OVERFLOW_POLICIES}"
+            )
+        super().__init__(maxsize=maxsize)
+        self.policy = policy
+        self.dropped = 0
+        self.consumed = 0
+        self._on_drop = on_drop
+
+    def offer(self, item: Any, timeout: Optional[float] = None) -> bool:
+        """Enqueue ``item`` according to the policy.
+
+        Returns ``False`` when ``item`` itself was discarded.
+        """
+        if self.policy == BLOCK:
+            self.put(item, timeout=timeout)
+            return True
+
+        evicted: list[Any] = []
+        accepted = True
+        with self.mutex:
+            if 0 < self.maxsize <= self._qsize():
+                self.dropped += 1
+                if self.policy == DROP_NEWEST:
+                    evicted.append(item)
+                    accepted = False
+                else:
+                    evicted.append(Queue._get(self))
+                    self.unfinished_tasks -= 1
+            if accepted:
+                self._put(item)
+                self.unfinished_tasks += 1
+                self.not_empty.notify()
+        if evicted and self._on_drop is not None:
+            self._on_drop(evicted[0])
+        return accepted
+
+    def _get(self) -> Any:
+        self.consumed += 1
+        return super()._get()
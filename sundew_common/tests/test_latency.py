@@ -0,0 +1,31 @@
+from sundew_common.latency import LatencyHistogram, LatencyRecorder
+
+
+def test_histogram_reports_nearest_rank_percentiles():
+    histogram = LatencyHistogram()
+    for value in range(1, 101):
+        histogram.record(float(value))
+
+    assert histogram.percentiles() == {"p50": 50.0, "p95": 95.0, "p99": 99.0}
+    assert histogram.summary()["count"] == 100
+
+
+def test_histogram_keeps_rolling_window():
+    histogram = LatencyHistogram(window=2)
+    for value in (100.0, 1.0, 2.0):
+        histogram.record(value)
+
+    assert histogram.percentiles((100,)) == {"p100": 2.0}
+    assert histogram.count == 3
+
+
+def test_recorder_ignores_missing_samples_and_summarizes_by_name():
+    recorder = LatencyRecorder()
+    recorder.record("inference", 10.0)
+    recorder.record("inference", None)
+
+    summary = recorder.summary()
+
+    assert list(summary) == ["inference"]
+    assert summary["inference"]["count"] == 1
+    assert summary["inference"]["p99"] == 10.0
@@ -0,0 +1,43 @@
+from queue import Full
+
+import pytest
+
+from sundew_common.queues import BLOCK, DROP_NEWEST, DROP_OLDEST, DropQueue
+
+
+def test_drop_oldest_evicts_head_and_counts():
+    dropped = []
+    queue = DropQueue(2, DROP_OLDEST, on_drop=dropped.append)
+
+    assert queue.offer(1) is True
+    assert queue.offer(2) is True
+    assert queue.offer(3) is True
+
+    assert [queue.get_nowait(), queue.get_nowait()] == [2, 3]
+    assert queue.dropped == 1
+    assert queue.consumed == 2
+    assert dropped == [1]
+
+
+def test_drop_newest_rejects_offered_item():
+    queue = DropQueue(1, DROP_NEWEST)
+
+    assert queue.offer("a") is True
+    assert queue.offer("b") is False
+
+    assert queue.get_nowait() == "a"
+    assert queue.dropped == 1
+
+
+def test_block_policy_times_out_when_full():
+    queue = DropQueue(1, BLOCK)
+    queue.offer("a")
+
+    with pytest.raises(Full):
+        queue.offer("b", timeout=0.01)
+    assert queue.dropped == 0
+
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError):
+        DropQueue(1, "spill")